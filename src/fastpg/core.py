@@ -1,50 +1,68 @@
 import asyncio
 from collections.abc import Mapping
 from contextlib import asynccontextmanager
+from operator import itemgetter
 from typing import Any, Iterator, List, Optional, Sequence, Tuple, cast
 
 import asyncpg
+from asyncpg.exceptions import InternalClientError
 from asyncpg.pgproto.pgproto import UUID
 
-from .utils import compile_query, compile_value
+from .utils import compile_query, compile_value, install_uvloop, parse_insert
+
+_COPY_MIN_ROWS = 1024
+
+# COPY only behaves like INSERT for plain and partitioned tables without INSERT
+# rules or row-level security (views can't be copied into, rules are ignored by
+# COPY and COPY FROM is rejected on tables with row-level security)
+_COPY_TARGET_QUERY = """
+select c.relkind in ('r', 'p') and not c.relrowsecurity and not exists (
+    select 1 from pg_catalog.pg_rewrite r where r.ev_class = c.oid and r.ev_type = '3'
+)
+from pg_catalog.pg_class c
+where c.oid = pg_catalog.to_regclass($1)
+"""
 
 
 class Record(Mapping):
-    __slots__ = "_rec"
+    __slots__ = ("_rec", "_keys")
 
     def __init__(self, rec: asyncpg.Record):
         self._rec = rec
+        self._keys = None
 
     def _get(self, key: Any) -> Any:
-        if type(key) == str:
+        if isinstance(key, str):
             val = self._rec.get(key)
         else:
             val = self._rec[key]
 
-        if type(val) == UUID:
+        if isinstance(val, UUID):
             return str(val)
         return val
 
-    def __getattr__(self, name: str) -> Any:
-        return self._get(name)
+    # Field access goes straight to `_get` (no extra Python frame per lookup)
+    __getattr__ = _get
+    __getitem__ = _get
 
     def keys(self) -> Tuple[str]:
-        return tuple([k for k in self._rec.keys()])
+        # asyncpg records are immutable, so the keys only need to be read once
+        if self._keys is None:
+            self._keys = tuple(self._rec.keys())
+        return self._keys
 
     def values(self) -> Tuple[Any]:
-        return tuple([self._get(k) for k in self._rec.keys()])
+        return tuple(map(self._get, self.keys()))
 
     def items(self) -> List[Tuple[str, Any]]:
-        return list(zip(self.keys(), self.values()))
+        keys = self.keys()
+        return list(zip(keys, map(self._get, keys)))
 
     def __len__(self) -> int:
         return len(self._rec)
 
-    def __getitem__(self, key: Any) -> Any:
-        return self._get(key)
-
     def __iter__(self) -> Iterator:
-        return iter(self._rec.keys())
+        return iter(self.keys())
 
 
 class Database:
@@ -58,6 +76,7 @@ class Database:
         port: int | None = None,
         database: str | None = None,
         force_rollback: bool = False,
+        use_uvloop: bool = False,
         **kwargs,
     ):
         if dsn is None:
@@ -74,6 +93,9 @@ class Database:
         self._pool: asyncpg.Pool | None = None
         self._global_connection: asyncpg.Connection | None = None
 
+        if use_uvloop:
+            install_uvloop()
+
     async def connect(self):
         if self._force_rollback:
             assert self._global_connection is None, "Database already connected"
@@ -120,8 +142,8 @@ class Database:
 
     async def execute(self, query: str, values: Optional[dict] = None):
         assert self._pool is not None, "Database is not connected"
-        async with self.connection() as conn:
-            await conn.execute(query, values)
+        compiled_query, ordered_values = compile_query(query, values)
+        await self._pool.execute(compiled_query, *ordered_values)
 
     async def execute_many(self, query: str, values: List[dict]):
         assert self._pool is not None, "Database is not connected"
@@ -130,18 +152,30 @@ class Database:
 
     async def fetch_val(self, query: str, values: Optional[dict] = None):
         assert self._pool is not None, "Database is not connected"
-        async with self.connection() as conn:
-            return await conn.fetch_val(query, values)
+        compiled_query, ordered_values = compile_query(query, values)
+        return await self._pool.fetchval(compiled_query, *ordered_values)
 
-    async def fetch_one(self, query: str, values: Optional[dict] = None):
+    async def fetch_one(
+        self, query: str, values: Optional[dict] = None, *, wrap: bool = True
+    ):
         assert self._pool is not None, "Database is not connected"
-        async with self.connection() as conn:
-            return await conn.fetch_one(query, values)
+        compiled_query, ordered_values = compile_query(query, values)
+        rec = await self._pool.fetchrow(compiled_query, *ordered_values)
 
-    async def fetch_many(self, query: str, values: Optional[dict] = None):
+        if not wrap:
+            return rec
+        return Record(rec) if rec else None
+
+    async def fetch_many(
+        self, query: str, values: Optional[dict] = None, *, wrap: bool = True
+    ):
         assert self._pool is not None, "Database is not connected"
-        async with self.connection() as conn:
-            return await conn.fetch_many(query, values)
+        compiled_query, ordered_values = compile_query(query, values)
+        recs = await self._pool.fetch(compiled_query, *ordered_values)
+
+        if not wrap:
+            return recs
+        return list(map(Record, recs))
 
     async def copy_records_to_table(
         self,
@@ -167,6 +201,7 @@ class Connection:
         host: str | None = None,
         port: int | None = None,
         database: str | None = None,
+        **kwargs,
     ):
         if dsn is None:
             assert user is not None, "Missing user (no DSN provided)"
@@ -175,11 +210,14 @@ class Connection:
             assert port is not None, "Missing port (no DSN provided)"
             dsn = f"postgresql://{user}:{password}@{host}:{port}/{database}"
         self.dsn = dsn
+        self.kwargs = kwargs
         self._connection: asyncpg.Connection | None = None
 
     async def connect(self):
         assert self._connection is None, "Connection already connected"
-        self._connection = cast(asyncpg.Connection, await asyncpg.connect(self.dsn))
+        self._connection = cast(
+            asyncpg.Connection, await asyncpg.connect(self.dsn, **self.kwargs)
+        )
 
     async def close(self, *, timeout: float | None = None):
         assert self._connection is not None, "Connection is not connected"
@@ -199,6 +237,28 @@ class Connection:
 
     async def execute_many(self, query: str, values: List[dict]):
         assert self._connection is not None, "Connection is not acquired"
+        if len(values) >= _COPY_MIN_ROWS:
+            insert = parse_insert(query)
+            if insert is not None and await self._can_copy(insert, values[0]):
+                schema_name, table_name, columns, keys = insert
+                try:
+                    # The savepoint keeps a failed COPY from aborting an enclosing
+                    # transaction, so the fallback below can still run
+                    async with self._connection.transaction():
+                        await self._copy_dicts(
+                            table_name,
+                            rows=values,
+                            keys=keys,
+                            columns=columns,
+                            schema_name=schema_name,
+                        )
+                except InternalClientError:
+                    # Raised for column types asyncpg has no binary encoder for (e.g.
+                    # extension types using text I/O), which executemany handles
+                    pass
+                else:
+                    return
+
         compiled_query, ordered_values = compile_query(query, values)
         await self._connection.executemany(compiled_query, ordered_values)
 
@@ -220,20 +280,31 @@ class Connection:
     #     ...
 
     async def fetch_one(
-        self, query: str, values: Optional[dict] = None, cast: Mapping | None = None
+        self,
+        query: str,
+        values: Optional[dict] = None,
+        cast: Mapping | None = None,
+        *,
+        wrap: bool = True,
     ):
         assert self._connection is not None, "Connection is not acquired"
         compiled_query, ordered_values = compile_query(query, values)
         rec = await self._connection.fetchrow(compiled_query, *ordered_values)
 
+        if not wrap:
+            return rec
         return Record(rec) if rec else None
 
-    async def fetch_many(self, query: str, values: Optional[dict] = None):
+    async def fetch_many(
+        self, query: str, values: Optional[dict] = None, *, wrap: bool = True
+    ):
         assert self._connection is not None, "Connection is not acquired"
         compiled_query, ordered_values = compile_query(query, values)
         recs = await self._connection.fetch(compiled_query, *ordered_values)
 
-        return [Record(rec) for rec in recs]
+        if not wrap:
+            return recs
+        return list(map(Record, recs))
 
     async def copy_records_to_table(
         self,
@@ -245,10 +316,46 @@ class Connection:
         assert self._connection is not None, "Connection is not acquired"
         await self._connection.copy_records_to_table(
             table_name,
-            records=[[compile_value(v) for v in rec] for rec in records],
+            records=(tuple(map(compile_value, rec)) for rec in records),
             columns=columns,
         )
 
+    async def _can_copy(self, insert: tuple, first_row: Mapping) -> bool:
+        assert self._connection is not None, "Connection is not acquired"
+        schema_name, table_name, _, keys = insert
+        # executemany rejects rows whose keys don't match the statement's parameters,
+        # so COPY must too
+        if set(first_row.keys()) != set(keys):
+            return False
+
+        # Identifiers from `parse_insert` are unquoted names, so quoting them is safe
+        name = f'"{table_name}"'
+        if schema_name is not None:
+            name = f'"{schema_name}".{name}'
+        return bool(await self._connection.fetchval(_COPY_TARGET_QUERY, name))
+
+    async def _copy_dicts(
+        self,
+        table_name: str,
+        *,
+        rows: Sequence[Mapping],
+        keys: Sequence[str],
+        columns: Sequence[str],
+        schema_name: str | None = None,
+    ):
+        assert self._connection is not None, "Connection is not acquired"
+        get_values = itemgetter(*keys)
+        if len(keys) == 1:
+            records = ((compile_value(get_values(row)),) for row in rows)
+        else:
+            records = (tuple(map(compile_value, get_values(row))) for row in rows)
+        await self._connection.copy_records_to_table(
+            table_name,
+            records=records,
+            columns=list(columns),
+            schema_name=schema_name,
+        )
+
     @asynccontextmanager
     async def transaction(self, *, force_rollback: bool = False):
         assert self._connection is not None, "Connection is not connected"
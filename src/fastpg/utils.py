@@ -1,43 +1,156 @@
+import asyncio
 import json
 import re
+import sys
+from collections.abc import Mapping, Sequence
 from enum import Enum
-from typing import List
+from functools import lru_cache
+from operator import itemgetter
+from typing import Callable, Dict, Optional, Tuple
 from uuid import UUID
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
 
-def compile_value(value):
-    if isinstance(value, dict):
-        return json.dumps(value)
-    elif isinstance(value, UUID):
-        return str(value)
-    elif isinstance(value, Enum):
-        return value.value
+try:
+    import uvloop
+except ImportError:  # pragma: no cover
+    uvloop = None
+
+_PARAM_RE = re.compile(r":([_a-zA-Z][_a-zA-Z0-9]*)")
+_IDENT_RE = re.compile(r"[_a-zA-Z][_a-zA-Z0-9$]*")
+_INSERT_RE = re.compile(
+    r"^\s*INSERT\s+INTO\s+(?:([_a-zA-Z][_a-zA-Z0-9$]*)\.)?([_a-zA-Z][_a-zA-Z0-9$]*)"
+    r"\s*\(([^)]+)\)\s*VALUES\s*\(([^)]+)\)\s*;?\s*$",
+    re.IGNORECASE,
+)
+
+if orjson is not None:
+    # Datetimes are passed through (i.e. rejected) so they fail the same way they do
+    # with `json`; anything orjson can't encode falls back to `json.dumps`
+    _ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+    def _dumps(value) -> str:
+        try:
+            return orjson.dumps(value, option=_ORJSON_OPTIONS).decode()
+        except orjson.JSONEncodeError:
+            # Compact separators so a column doesn't mix formatting by value
+            return json.dumps(value, separators=(",", ":"))
+
+else:
+    _dumps = json.dumps
+
+
+def _enum_value(value: Enum):
+    return value.value
+
+
+def _resolve_compiler(type_: type) -> Optional[Callable]:
+    if issubclass(type_, dict):
+        return _dumps
+    elif issubclass(type_, UUID):
+        return str
+    elif issubclass(type_, Enum):
+        return _enum_value
     else:
+        return None
+
+
+# Compiler per concrete value type (None means the value is passed through as is).
+# Subclasses are resolved with the isinstance rules above on first sight.
+_COMPILERS: Dict[type, Optional[Callable]] = {
+    dict: _dumps,
+    UUID: str,
+}
+
+
+def compile_value(value):
+    try:
+        compiler = _COMPILERS[type(value)]
+    except KeyError:
+        compiler = _COMPILERS[type(value)] = _resolve_compiler(type(value))
+
+    if compiler is None:
         return value
+    return compiler(value)
 
 
-def compile_query(query: str, values: dict | List[dict] | None = None):
-    if type(values) is None:
-        return query, tuple()
+@lru_cache(maxsize=1024)
+def _compile_sql(query: str, keys: Tuple[str, ...]) -> str:
+    positions = {k: f"${i}" for i, k in enumerate(keys, start=1)}
+    return _PARAM_RE.sub(lambda m: positions.get(m.group(1), m.group(0)), query)
+
+
+def compile_query(query: str, values: Mapping | Sequence[Mapping] | None = None):
+    if values is None:
+        return query, ()
 
     compiled_query = query
     ordered_values = []
 
-    if type(values) is dict:
-        for i, (k, v) in enumerate(values.items(), start=1):
-            compiled_query = re.sub(f":{k}(?![_a-zA-Z0-9])", f"${i}", compiled_query)
-            ordered_values.append(compile_value(v))
-
-    if type(values) is list:
-        ordered_values.append([])
-        for i, (k, v) in enumerate(values[0].items(), start=1):
-            compiled_query = re.sub(f":{k}(?![_a-zA-Z0-9])", f"${i}", compiled_query)
-            ordered_values[0].append(compile_value(v))
-        if len(values) > 1:
-            for value_set in values[1:]:
-                ordered_value_set = []
-                for base_k in values[0].keys():
-                    ordered_value_set.append(compile_value(value_set[base_k]))
-                ordered_values.append(ordered_value_set)
+    if isinstance(values, Mapping):
+        compiled_query = _compile_sql(query, tuple(values.keys()))
+        ordered_values = [compile_value(v) for v in values.values()]
+    elif isinstance(values, (list, tuple)):
+        keys = tuple(values[0].keys())
+        compiled_query = _compile_sql(query, keys)
+        if len(keys) > 1:
+            get_values = itemgetter(*keys)
+            ordered_values = [list(map(compile_value, get_values(v))) for v in values]
+        elif keys:
+            (key,) = keys
+            ordered_values = [[compile_value(v[key])] for v in values]
+        else:
+            ordered_values = [[] for _ in values]
 
     return compiled_query, ordered_values
+
+
+@lru_cache(maxsize=1024)
+def parse_insert(
+    query: str,
+) -> Optional[Tuple[Optional[str], str, Tuple[str, ...], Tuple[str, ...]]]:
+    # Only plain `INSERT INTO t (cols) VALUES (:a, :b, ...)` statements can be
+    # rewritten as a COPY: every value must be a bare parameter and there must be
+    # nothing after the VALUES list (no ON CONFLICT, RETURNING, etc.).
+    match = _INSERT_RE.match(query)
+    if match is None:
+        return None
+
+    schema_name, table_name, raw_columns, raw_params = match.groups()
+    columns = tuple(c.strip() for c in raw_columns.split(","))
+    params = tuple(p.strip() for p in raw_params.split(","))
+    if len(columns) != len(params):
+        return None
+    if not all(_IDENT_RE.fullmatch(c) for c in columns):
+        return None
+    param_matches = [_PARAM_RE.fullmatch(p) for p in params]
+    if not all(param_matches):
+        return None
+
+    # Unquoted identifiers are case-folded by Postgres, while asyncpg quotes the
+    # names it is given for COPY
+    return (
+        schema_name.lower() if schema_name else None,
+        table_name.lower(),
+        tuple(c.lower() for c in columns),
+        tuple(m.group(1) for m in param_matches),
+    )
+
+
+def install_uvloop():
+    # The policy can only affect loops created after it is set, and it must not
+    # override a policy that was explicitly chosen elsewhere. Event loop policies are
+    # deprecated as of Python 3.14, where `uvloop.run()` should be used instead
+    if uvloop is None or sys.version_info >= (3, 14):
+        return
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        return
+    if type(asyncio.get_event_loop_policy()) is asyncio.DefaultEventLoopPolicy:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())